@@ -8,10 +8,28 @@ import time
 import threading
 from datetime import datetime
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from collections import deque
+from itertools import islice
 import json
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard json module
+    orjson = None
+
+from kernels import sense_batch
+
+
+# Safe thresholds (WHO guidelines), bound at module level for hot-path lookups
+PM25_THR = 25.0  # ug/m3
+PM10_THR = 50.0  # ug/m3
+
+# Shared generator for all simulated sensor noise
+_rng = np.random.default_rng()
+
 
 @dataclass
 class DustReading:
@@ -29,8 +47,10 @@ class SmartDustMote:
     """Simulates a single Smart Dust mote (sensor node)"""
     
     # Safe thresholds (WHO guidelines)
-    PM25_SAFE_THRESHOLD = 25.0  # ug/m3
-    PM10_SAFE_THRESHOLD = 50.0  # ug/m3
+    PM25_SAFE_THRESHOLD = PM25_THR  # ug/m3
+    PM10_SAFE_THRESHOLD = PM10_THR  # ug/m3
+    
+    HISTORY_SIZE = 100  # Number of recent readings kept per mote
     
     def __init__(self, mote_id: str, location: tuple, base_pollution: float = 0.0):
         """
@@ -45,50 +65,63 @@ class SmartDustMote:
         self.location = location
         self.base_pollution = base_pollution
         self.is_active = True
-        self.reading_history = deque(maxlen=100)  # Store last 100 readings
-        
-    def sense(self) -> DustReading:
+        # Ring buffers holding the last HISTORY_SIZE PM readings, with running
+        # sums so averages never need to rescan the buffers
+        self._pm25_history = np.zeros(self.HISTORY_SIZE, dtype=np.float64)
+        self._pm10_history = np.zeros(self.HISTORY_SIZE, dtype=np.float64)
+        self._pm25_sum = 0.0
+        self._pm10_sum = 0.0
+        self._history_idx = 0
+        self._history_count = 0
+        
+    def sense(self, timestamp: datetime = None) -> DustReading:
         """
         Generate a dust reading with realistic variations
         
+        Args:
+            timestamp: Time of the reading; defaults to the current time
+        
         Returns:
             DustReading object with sensor data
         """
-        # Simulate realistic dust levels with some randomness
-        # Higher base_pollution leads to higher readings
-        pm25_base = 10.0 + (self.base_pollution * 40.0)
-        pm10_base = 20.0 + (self.base_pollution * 60.0)
-        
-        # Add realistic variations (simulating wind, time of day, etc.)
-        time_factor = 1.0 + 0.3 * random.gauss(0, 1)  # Random variation
-        pm25 = max(0, pm25_base * time_factor + random.gauss(0, 5))
-        pm10 = max(0, pm10_base * time_factor + random.gauss(0, 8))
-        
-        # Simulate environmental conditions
-        temperature = 20.0 + random.gauss(0, 5)  # Room temperature with variation
-        humidity = 40.0 + random.gauss(0, 15)  # Humidity with variation
-        humidity = max(0, min(100, humidity))  # Clamp to 0-100
+        # Run the batch sensing kernel for this mote alone
+        values = np.empty((4, 1), dtype=np.float32)
+        sense_batch(np.array([self.base_pollution], dtype=np.float32),
+                     _rng.standard_normal((5, 1), dtype=np.float32),
+                     values[0], values[1], values[2], values[3])
+        pm25, pm10, temperature, humidity = values[:, 0].tolist()
         
         reading = DustReading(
             mote_id=self.mote_id,
-            timestamp=datetime.now(),
-            pm25=round(pm25, 2),
-            pm10=round(pm10, 2),
-            temperature=round(temperature, 2),
-            humidity=round(humidity, 2),
+            timestamp=timestamp or datetime.now(),
+            pm25=pm25,
+            pm10=pm10,
+            temperature=temperature,
+            humidity=humidity,
             location=self.location
         )
         
-        self.reading_history.append(reading)
+        self.record_levels(reading.pm25, reading.pm10)
         return reading
     
+    def record_levels(self, pm25: float, pm10: float):
+        """Store PM levels in the mote's history ring buffers"""
+        i = self._history_idx
+        # Slots start at zero, so this also holds before the buffer wraps
+        self._pm25_sum += pm25 - self._pm25_history[i]
+        self._pm10_sum += pm10 - self._pm10_history[i]
+        self._pm25_history[i] = pm25
+        self._pm10_history[i] = pm10
+        self._history_idx = (self._history_idx + 1) % self.HISTORY_SIZE
+        self._history_count = min(self._history_count + 1, self.HISTORY_SIZE)
+    
     def get_average_pollution(self) -> Dict[str, float]:
         """Calculate average pollution levels from recent readings"""
-        if not self.reading_history:
+        if not self._history_count:
             return {"pm25": 0.0, "pm10": 0.0}
         
-        avg_pm25 = sum(r.pm25 for r in self.reading_history) / len(self.reading_history)
-        avg_pm10 = sum(r.pm10 for r in self.reading_history) / len(self.reading_history)
+        avg_pm25 = float(self._pm25_sum) / self._history_count
+        avg_pm10 = float(self._pm10_sum) / self._history_count
         
         return {
             "pm25": round(avg_pm25, 2),
@@ -97,23 +130,127 @@ class SmartDustMote:
     
     def is_pollution_unsafe(self, reading: DustReading) -> bool:
         """Check if pollution levels exceed safe thresholds"""
-        return (reading.pm25 > self.PM25_SAFE_THRESHOLD or 
-                reading.pm10 > self.PM10_SAFE_THRESHOLD)
+        return reading.pm25 > PM25_THR or reading.pm10 > PM10_THR
+
+
+# Severity bucket edges: a level above k edges has severity _SEVERITY[k].
+# Edges below the safe threshold are raised to it so the array stays sorted
+# for any threshold, and float64 keeps them equal to the Python constants.
+_PM25_BUCKETS = np.maximum(np.array([PM25_THR, 35.0, 50.0], dtype=np.float64), PM25_THR)
+_PM10_BUCKETS = np.maximum(np.array([PM10_THR, 70.0, 100.0], dtype=np.float64), PM10_THR)
+_SEVERITY = ("LOW", "MODERATE", "HIGH", "CRITICAL")
 
 
 class DataProcessor:
     """Processes and analyzes dust data from multiple motes"""
     
+    BUFFER_SIZE = 1000  # Number of readings kept in memory
+    STATS_WINDOW = 100  # Number of recent readings used for statistics
+    
     def __init__(self):
-        self.all_readings: List[DustReading] = []
         self.alert_history: List[Dict] = []
+        
+        # Readings are stored column-wise in ring buffers of BUFFER_SIZE rows
+        size = self.BUFFER_SIZE
+        self.ts = np.zeros(size, dtype='datetime64[us]')
+        self.mote_idx = np.zeros(size, dtype=np.int32)
+        self.pm25 = np.zeros(size, dtype=np.float32)
+        self.pm10 = np.zeros(size, dtype=np.float32)
+        self.temp = np.zeros(size, dtype=np.float32)
+        self.humid = np.zeros(size, dtype=np.float32)
+        self.loc = np.zeros((size, 2), dtype=np.float64)
+        self._write_idx = 0
+        self._count = 0
+        
+        # Mote IDs are stored once; rows refer to them by index
+        self.mote_ids: List[str] = []
+        self._mote_index: Dict[str, int] = {}
+    
+    def add_reading(self, row: Tuple):
+        """
+        Add a new reading to the processor
+        
+        Args:
+            row: (mote_id, timestamp, pm25, pm10, temperature, humidity, location),
+                in the same order as the DustReading fields
+        """
+        mote_id, timestamp, pm25, pm10, temperature, humidity, location = row
+        
+        # Overwrite the oldest row once BUFFER_SIZE is reached
+        i = self._write_idx
+        self.ts[i] = timestamp
+        self.mote_idx[i] = self._mote_index_of(mote_id)
+        self.pm25[i] = pm25
+        self.pm10[i] = pm10
+        self.temp[i] = temperature
+        self.humid[i] = humidity
+        self.loc[i] = location
+        self._write_idx = (i + 1) % self.BUFFER_SIZE
+        self._count = min(self._count + 1, self.BUFFER_SIZE)
+    
+    def add_batch(self, mote_ids: List[str], timestamp: datetime, pm25: np.ndarray, pm10: np.ndarray,
+                  temperature: np.ndarray, humidity: np.ndarray, locations: np.ndarray):
+        """
+        Add the readings of one tick to the processor
+        
+        Args:
+            mote_ids: IDs of the motes that produced the readings
+            timestamp: Time shared by all readings
+            pm25, pm10, temperature, humidity: Sensor values, one per mote
+            locations: (n, 2) array of mote coordinates
+        """
+        # Only the newest BUFFER_SIZE readings would survive anyway
+        size = self.BUFFER_SIZE
+        n = min(len(mote_ids), size)
+        skip = len(mote_ids) - n
+        
+        # Target rows wrap around the end of the ring buffers
+        rows = (self._write_idx + np.arange(n)) % size
+        self.ts[rows] = timestamp
+        self.mote_idx[rows] = [self._mote_index_of(mote_id) for mote_id in mote_ids[skip:]]
+        self.pm25[rows] = pm25[skip:]
+        self.pm10[rows] = pm10[skip:]
+        self.temp[rows] = temperature[skip:]
+        self.humid[rows] = humidity[skip:]
+        self.loc[rows] = locations[skip:]
+        self._write_idx = (self._write_idx + n) % size
+        self._count = min(self._count + n, size)
+    
+    def _mote_index_of(self, mote_id: str) -> int:
+        """Return the index of a mote ID, registering it on first use"""
+        index = self._mote_index.get(mote_id)
+        if index is None:
+            index = self._mote_index[mote_id] = len(self.mote_ids)
+            self.mote_ids.append(mote_id)
+        return index
+    
+    def _recent(self, buffer: np.ndarray, n: int, write_idx: int, stored: int) -> np.ndarray:
+        """
+        Return the last n values written to a ring buffer
+        
+        write_idx and stored are a snapshot of _write_idx and _count taken by
+        the caller, so that every column read from one snapshot covers the
+        same window even while another thread keeps adding readings.
+        """
+        n = min(n, stored)
+        if n <= write_idx:
+            return buffer[write_idx - n:write_idx]
+        # The window wraps around the end of the buffer
+        return np.concatenate((buffer[write_idx - n:], buffer[:write_idx]))
     
-    def add_reading(self, reading: DustReading):
-        """Add a new reading to the processor"""
-        self.all_readings.append(reading)
-        # Keep only last 1000 readings to manage memory
-        if len(self.all_readings) > 1000:
-            self.all_readings = self.all_readings[-1000:]
+    def get_recent_columns(self, count: int = 50) -> Dict[str, np.ndarray]:
+        """Get the most recent readings as columns, oldest first"""
+        w, c = self._write_idx, self._count
+        mote_idx = self._recent(self.mote_idx, count, w, c)
+        return {
+            "mote_id": np.asarray(self.mote_ids, dtype=str)[mote_idx],
+            "timestamp": self._recent(self.ts, count, w, c),
+            "pm25": self._recent(self.pm25, count, w, c),
+            "pm10": self._recent(self.pm10, count, w, c),
+            "temperature": self._recent(self.temp, count, w, c),
+            "humidity": self._recent(self.humid, count, w, c),
+            "location": self._recent(self.loc, count, w, c),
+        }
     
     def analyze_reading(self, reading: DustReading) -> Dict:
         """
@@ -122,55 +259,71 @@ class DataProcessor:
         Returns:
             Dictionary with analysis results
         """
-        status = "SAFE"
-        severity = "LOW"
-        
-        if reading.pm25 > SmartDustMote.PM25_SAFE_THRESHOLD:
-            status = "UNSAFE"
-            if reading.pm25 > 50:
-                severity = "CRITICAL"
-            elif reading.pm25 > 35:
-                severity = "HIGH"
-            else:
-                severity = "MODERATE"
-        
-        if reading.pm10 > SmartDustMote.PM10_SAFE_THRESHOLD:
-            status = "UNSAFE"
-            if reading.pm10 > 100:
-                severity = "CRITICAL"
-            elif reading.pm10 > 70:
-                severity = "HIGH"
-            else:
-                severity = "MODERATE"
+        unsafe, severity = self.analyze_batch(np.array([reading.pm25]), np.array([reading.pm10]))
+        return self.build_analysis(reading, bool(unsafe[0]), int(severity[0]))
+    
+    def analyze_batch(self, pm25: np.ndarray, pm10: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Classify many readings at once
         
+        Args:
+            pm25: PM2.5 levels
+            pm10: PM10 levels
+        
+        Returns:
+            (unsafe, severity) arrays: a boolean mask of readings above a safe
+            threshold and an index into _SEVERITY for each reading
+        """
+        # searchsorted counts the bucket edges strictly below each level
+        severity = np.maximum(np.searchsorted(_PM25_BUCKETS, pm25),
+                              np.searchsorted(_PM10_BUCKETS, pm10))
+        unsafe = severity > 0
+        return unsafe, severity
+    
+    def build_analysis(self, reading: DustReading, unsafe: bool, severity: int) -> Dict:
+        """
+        Build the analysis dictionary for a classified reading
+        
+        Args:
+            reading: The dust reading
+            unsafe: Whether the reading exceeds a safe threshold
+            severity: Index into _SEVERITY, as returned by analyze_batch
+        """
         return {
-            "status": status,
-            "severity": severity,
+            "status": "UNSAFE" if unsafe else "SAFE",
+            "severity": _SEVERITY[severity],
             "pm25_level": reading.pm25,
             "pm10_level": reading.pm10,
-            "pm25_threshold": SmartDustMote.PM25_SAFE_THRESHOLD,
-            "pm10_threshold": SmartDustMote.PM10_SAFE_THRESHOLD
+            "pm25_threshold": PM25_THR,
+            "pm10_threshold": PM10_THR
         }
     
     def get_statistics(self) -> Dict:
         """Calculate overall statistics from all readings"""
-        if not self.all_readings:
+        w, c = self._write_idx, self._count
+        if not c:
             return {}
         
-        recent_readings = self.all_readings[-100:]  # Last 100 readings
+        pm25_values = self._recent(self.pm25, self.STATS_WINDOW, w, c)
+        pm10_values = self._recent(self.pm10, self.STATS_WINDOW, w, c)
         
-        pm25_values = [r.pm25 for r in recent_readings]
-        pm10_values = [r.pm10 for r in recent_readings]
+        # Aggregate at full precision and round once for presentation
+        aggregates = np.array([
+            pm25_values.mean(), pm10_values.mean(),
+            pm25_values.max(), pm10_values.max(),
+            pm25_values.min(), pm10_values.min(),
+        ], dtype=np.float64).round(2).tolist()
+        avg_pm25, avg_pm10, max_pm25, max_pm10, min_pm25, min_pm10 = aggregates
         
         return {
-            "total_readings": len(self.all_readings),
-            "recent_readings": len(recent_readings),
-            "avg_pm25": round(sum(pm25_values) / len(pm25_values), 2),
-            "avg_pm10": round(sum(pm10_values) / len(pm10_values), 2),
-            "max_pm25": round(max(pm25_values), 2),
-            "max_pm10": round(max(pm10_values), 2),
-            "min_pm25": round(min(pm25_values), 2),
-            "min_pm10": round(min(pm10_values), 2),
+            "total_readings": c,
+            "recent_readings": len(pm25_values),
+            "avg_pm25": avg_pm25,
+            "avg_pm10": avg_pm10,
+            "max_pm25": max_pm25,
+            "max_pm10": max_pm10,
+            "min_pm25": min_pm25,
+            "min_pm10": min_pm10,
         }
     
     def get_pollution_map(self, motes: List[SmartDustMote]) -> Dict:
@@ -183,60 +336,74 @@ class DataProcessor:
                     "location": mote.location,
                     "pm25": avg["pm25"],
                     "pm10": avg["pm10"],
-                    "status": "UNSAFE" if (avg["pm25"] > SmartDustMote.PM25_SAFE_THRESHOLD or 
-                                          avg["pm10"] > SmartDustMote.PM10_SAFE_THRESHOLD) else "SAFE"
+                    "status": "UNSAFE" if (avg["pm25"] > PM25_THR or avg["pm10"] > PM10_THR) else "SAFE"
                 }
         return pollution_map
 
 
+# Threshold suffixes for alert messages, formatted once
+_PM25_SUFFIX = f" ug/m3 (threshold: {PM25_THR})"
+_PM10_SUFFIX = f" ug/m3 (threshold: {PM10_THR})"
+
+
 class AlertSystem:
     """Generates and manages pollution alerts"""
     
     def __init__(self):
-        self.alerts: List[Dict] = []
+        self.alerts: deque = deque(maxlen=100)  # Keep only last 100 alerts
         self.alert_callbacks = []
+        # Readings from one tick share a timestamp, so format it only once
+        self._last_timestamp = None
+        self._last_timestamp_iso = None
     
-    def check_and_alert(self, reading: DustReading, analysis: Dict):
+    def check_and_alert(self, reading: DustReading, analysis: Optional[Dict]):
         """
         Check if alert should be generated and create it
         
         Args:
             reading: The dust reading
-            analysis: Analysis results from DataProcessor
+            analysis: Analysis results from DataProcessor, or None for a
+                reading already known to be safe
         """
-        if analysis["status"] == "UNSAFE":
-            alert = {
-                "timestamp": reading.timestamp.isoformat(),
-                "mote_id": reading.mote_id,
-                "location": reading.location,
-                "severity": analysis["severity"],
-                "pm25": reading.pm25,
-                "pm10": reading.pm10,
-                "message": self._generate_alert_message(reading, analysis)
-            }
-            
-            self.alerts.append(alert)
-            # Keep only last 100 alerts
-            if len(self.alerts) > 100:
-                self.alerts = self.alerts[-100:]
-            
-            # Trigger callbacks
-            for callback in self.alert_callbacks:
-                callback(alert)
-    
-    def _generate_alert_message(self, reading: DustReading, analysis: Dict) -> str:
+        if analysis is None or analysis["status"] != "UNSAFE":
+            return
+        
+        if reading.timestamp != self._last_timestamp:
+            self._last_timestamp = reading.timestamp
+            self._last_timestamp_iso = reading.timestamp.isoformat()
+        
+        alert = {
+            "timestamp": self._last_timestamp_iso,
+            "timestamp_dt": reading.timestamp,
+            "mote_id": reading.mote_id,
+            "location": reading.location,
+            "severity": analysis["severity"],
+            "pm25": round(reading.pm25, 2),
+            "pm10": round(reading.pm10, 2),
+            "message": self._generate_alert_message(reading, analysis)
+        }
+        
+        self.alerts.append(alert)
+        
+        # Trigger callbacks
+        for callback in self.alert_callbacks:
+            callback(alert)
+    
+    def _generate_alert_message(self, reading: DustReading, analysis: Dict,
+                                _p25=PM25_THR, _p10=PM10_THR) -> str:
         """Generate human-readable alert message"""
         issues = []
-        if reading.pm25 > SmartDustMote.PM25_SAFE_THRESHOLD:
-            issues.append(f"PM2.5: {reading.pm25} ug/m3 (threshold: {SmartDustMote.PM25_SAFE_THRESHOLD})")
-        if reading.pm10 > SmartDustMote.PM10_SAFE_THRESHOLD:
-            issues.append(f"PM10: {reading.pm10} ug/m3 (threshold: {SmartDustMote.PM10_SAFE_THRESHOLD})")
+        if reading.pm25 > _p25:
+            issues.append(f"PM2.5: {reading.pm25:.2f}" + _PM25_SUFFIX)
+        if reading.pm10 > _p10:
+            issues.append(f"PM10: {reading.pm10:.2f}" + _PM10_SUFFIX)
         
         return f"[!] {analysis['severity']} ALERT at Mote {reading.mote_id}: " + ", ".join(issues)
     
     def get_recent_alerts(self, count: int = 10) -> List[Dict]:
         """Get the most recent alerts"""
-        return self.alerts[-count:] if self.alerts else []
+        total = len(self.alerts)
+        return list(islice(self.alerts, max(0, total - count), total))
     
     def register_callback(self, callback):
         """Register a callback function to be called when alerts are generated"""
@@ -274,6 +441,41 @@ class SmartDustSimulation:
         print(f"\n[ALERT] {alert['message']}")
         print(f"   Location: {alert['location']} | Time: {alert['timestamp']}\n")
     
+    def _step(self, timestamp: datetime):
+        """
+        Run one simulation tick: sense, store, analyze and alert in array form
+        
+        Args:
+            timestamp: Time shared by all readings of this tick
+        """
+        active_motes = [m for m in self.motes if m.is_active]
+        # Model parameters are read from the motes every tick, so changes to
+        # self.motes or a mote's settings take effect immediately
+        base_pollution = np.array([m.base_pollution for m in active_motes], dtype=np.float32)
+        locations = np.array([m.location for m in active_motes], dtype=np.float64).reshape(-1, 2)
+        n = len(base_pollution)
+        
+        # Sense all active motes with one kernel call
+        pm25, pm10, temperature, humidity = np.empty((4, n), dtype=np.float32)
+        noise = _rng.standard_normal((5, n), dtype=np.float32)
+        sense_batch(base_pollution, noise, pm25, pm10, temperature, humidity)
+        
+        mote_ids = [m.mote_id for m in active_motes]
+        self.processor.add_batch(mote_ids, timestamp, pm25, pm10, temperature, humidity, locations)
+        pm25_list = pm25.tolist()
+        pm10_list = pm10.tolist()
+        for mote, mote_pm25, mote_pm10 in zip(active_motes, pm25_list, pm10_list):
+            mote.record_levels(mote_pm25, mote_pm10)
+        
+        # Analyze all readings at once; only unsafe readings can raise an alert
+        unsafe, severity = self.processor.analyze_batch(pm25, pm10)
+        for i in np.flatnonzero(unsafe).tolist():
+            mote = active_motes[i]
+            reading = DustReading(mote.mote_id, timestamp, pm25_list[i], pm10_list[i],
+                                  temperature[i].item(), humidity[i].item(), mote.location)
+            analysis = self.processor.build_analysis(reading, True, int(severity[i]))
+            self.alert_system.check_and_alert(reading, analysis)
+    
     def start_simulation(self, duration: int = 60):
         """
         Start the simulation
@@ -298,17 +500,8 @@ class SmartDustSimulation:
             while self.is_running and (time.time() - start_time) < duration:
                 iteration += 1
                 
-                # Collect readings from all motes
-                for mote in self.motes:
-                    if mote.is_active:
-                        reading = mote.sense()
-                        self.processor.add_reading(reading)
-                        
-                        # Analyze the reading
-                        analysis = self.processor.analyze_reading(reading)
-                        
-                        # Check for alerts
-                        self.alert_system.check_and_alert(reading, analysis)
+                # Collect readings from all motes, stamped with one shared time
+                self._step(datetime.now())
                 
                 # Display periodic status
                 if iteration % 5 == 0:  # Every 5 iterations
@@ -375,20 +568,32 @@ class SmartDustSimulation:
         stats = self.processor.get_statistics()
         pollution_map = self.processor.get_pollution_map(self.motes)
         
+        recent = self.processor.get_recent_columns(50)  # Last 50 readings
+        
         return {
             "statistics": stats,
             "pollution_map": pollution_map,
             "recent_readings": [
                 {
-                    "mote_id": r.mote_id,
-                    "timestamp": r.timestamp.isoformat(),
-                    "pm25": r.pm25,
-                    "pm10": r.pm10,
-                    "location": r.location
+                    "mote_id": mote_id,
+                    "timestamp": timestamp,
+                    "pm25": pm25,
+                    "pm10": pm10,
+                    "location": tuple(location)
                 }
-                for r in self.processor.all_readings[-50:]  # Last 50 readings
+                for mote_id, timestamp, pm25, pm10, location in zip(
+                    recent["mote_id"].tolist(),
+                    np.datetime_as_string(recent["timestamp"], unit='us').tolist(),
+                    recent["pm25"].astype(np.float64).round(2).tolist(),
+                    recent["pm10"].astype(np.float64).round(2).tolist(),
+                    recent["location"].tolist(),
+                )
             ],
-            "alerts": self.alert_system.get_recent_alerts(10)
+            # timestamp_dt is for in-process consumers; the ISO string is exported
+            "alerts": [
+                {key: value for key, value in alert.items() if key != "timestamp_dt"}
+                for alert in self.alert_system.get_recent_alerts(10)
+            ]
         }
 
 
@@ -408,8 +613,12 @@ def main():
     
     # Optionally save data to JSON
     data = simulation.get_data_for_visualization()
-    with open("dust_simulation_data.json", "w") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        with open("dust_simulation_data.json", "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open("dust_simulation_data.json", "w") as f:
+            json.dump(data, f, indent=2)
     print("\n[SAVED] Simulation data saved to 'dust_simulation_data.json'")
 
 
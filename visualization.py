@@ -3,11 +3,7 @@ Visualization module for Smart Dust Simulation
 Creates graphs and charts for dust detection data
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from datetime import datetime
-import json
-import os
+import numpy as np
 from smart_dust_system import SmartDustSimulation, SmartDustMote
 
 
@@ -27,8 +23,12 @@ class DustVisualizer:
             duration: Duration to run visualization in seconds
             update_interval: Update interval in seconds
         """
+        import matplotlib.pyplot as plt
+        import matplotlib.animation as animation
+        
         self.fig, self.axes = plt.subplots(2, 2, figsize=(14, 10))
         self.fig.suptitle('Smart Dust Technology - Real-Time Monitoring', fontsize=16, fontweight='bold')
+        self._init_plots()
         
         # Start simulation in background
         import threading
@@ -36,7 +36,8 @@ class DustVisualizer:
         sim_thread.daemon = True
         sim_thread.start()
         
-        # Animate plots
+        # Animate plots; axis limits and titles change every frame, so the
+        # whole figure is redrawn rather than blitted
         ani = animation.FuncAnimation(
             self.fig, 
             self._update_plots, 
@@ -47,25 +48,13 @@ class DustVisualizer:
         plt.tight_layout()
         plt.show()
     
-    def _update_plots(self, frame):
-        """Update all plots with latest data"""
-        if not self.simulation.processor.all_readings:
-            return
-        
-        # Clear axes
-        for ax in self.axes.flat:
-            ax.clear()
-        
-        recent_readings = self.simulation.processor.all_readings[-50:]
-        
+    def _init_plots(self):
+        """Create the artists that _update_plots refreshes on every frame"""
         # Plot 1: PM2.5 and PM10 over time
         ax1 = self.axes[0, 0]
-        timestamps = [r.timestamp for r in recent_readings]
-        pm25_values = [r.pm25 for r in recent_readings]
-        pm10_values = [r.pm10 for r in recent_readings]
-        
-        ax1.plot(timestamps, pm25_values, 'b-', label='PM2.5', linewidth=2)
-        ax1.plot(timestamps, pm10_values, 'r-', label='PM10', linewidth=2)
+        ax1.xaxis_date()
+        self._pm25_line, = ax1.plot([], [], 'b-', label='PM2.5', linewidth=2)
+        self._pm10_line, = ax1.plot([], [], 'r-', label='PM10', linewidth=2)
         ax1.axhline(y=SmartDustMote.PM25_SAFE_THRESHOLD, color='b', linestyle='--', alpha=0.5, label='PM2.5 Threshold')
         ax1.axhline(y=SmartDustMote.PM10_SAFE_THRESHOLD, color='r', linestyle='--', alpha=0.5, label='PM10 Threshold')
         ax1.set_xlabel('Time')
@@ -74,6 +63,64 @@ class DustVisualizer:
         ax1.legend()
         ax1.grid(True, alpha=0.3)
         
+        # Plot 2: Pollution map (scatter plot by location); the initial points
+        # set the axis limits, and mote labels are created as motes appear
+        ax2 = self.axes[0, 1]
+        motes = self.simulation.motes
+        self._map_scatter = ax2.scatter([m.location[0] for m in motes], [m.location[1] for m in motes],
+                                        c='green', s=0, alpha=0.6, edgecolors='black', linewidths=1)
+        self._map_labels = {}
+        ax2.set_xlabel('X Coordinate')
+        ax2.set_ylabel('Y Coordinate')
+        ax2.set_title('Pollution Map (Size = PM2.5 Level)')
+        ax2.grid(True, alpha=0.3)
+        
+        # Plot 3: Statistics bar chart
+        ax3 = self.axes[1, 0]
+        categories = ['Avg PM2.5', 'Avg PM10', 'Max PM2.5', 'Max PM10']
+        colors_bar = ['blue', 'red', 'darkblue', 'darkred']
+        self._stat_bars = ax3.bar(categories, [0] * len(categories), color=colors_bar, alpha=0.7, edgecolor='black')
+        self._stat_labels = [
+            ax3.text(bar.get_x() + bar.get_width()/2., 0, '', ha='center', va='bottom', fontweight='bold')
+            for bar in self._stat_bars
+        ]
+        ax3.axhline(y=SmartDustMote.PM25_SAFE_THRESHOLD, color='blue', linestyle='--', alpha=0.5)
+        ax3.axhline(y=SmartDustMote.PM10_SAFE_THRESHOLD, color='red', linestyle='--', alpha=0.5)
+        ax3.set_ylabel('Particle Concentration (ug/m3)')
+        ax3.set_title('Pollution Statistics')
+        ax3.grid(True, alpha=0.3, axis='y')
+        
+        # Plot 4: Alert timeline
+        ax4 = self.axes[1, 1]
+        ax4.xaxis_date()
+        self._alert_scatter = ax4.scatter([], [], c='red', s=100, alpha=0.7, edgecolors='black')
+        self._no_alerts_text = ax4.text(0.5, 0.5, 'No Alerts\nAll Levels Safe', 
+                                        ha='center', va='center', fontsize=14, color='green', 
+                                        transform=ax4.transAxes)
+        ax4.set_yticks([1, 2, 3, 4])
+        ax4.set_yticklabels(['LOW', 'MODERATE', 'HIGH', 'CRITICAL'])
+        ax4.set_ylim(0.5, 4.5)
+        ax4.set_xlabel('Time')
+        ax4.set_ylabel('Alert Severity')
+        ax4.set_title('Alert Timeline')
+        ax4.grid(True, alpha=0.3)
+    
+    def _update_plots(self, frame):
+        """Update all plots with latest data"""
+        import matplotlib.dates as mdates
+        
+        recent = self.simulation.processor.get_recent_columns(50)
+        if not len(recent['timestamp']):
+            return
+        
+        # Plot 1: PM2.5 and PM10 over time
+        ax1 = self.axes[0, 0]
+        timestamps = mdates.date2num(recent['timestamp'])
+        self._pm25_line.set_data(timestamps, recent['pm25'])
+        self._pm10_line.set_data(timestamps, recent['pm10'])
+        ax1.relim()
+        ax1.autoscale_view()
+        
         # Plot 2: Pollution map (scatter plot by location)
         ax2 = self.axes[0, 1]
         pollution_map = self.simulation.processor.get_pollution_map(self.simulation.motes)
@@ -89,69 +136,64 @@ class DustVisualizer:
             pm25_values_map.append(data['pm25'])
             colors.append('red' if data['status'] == 'UNSAFE' else 'green')
         
-        if x_coords:
-            scatter = ax2.scatter(x_coords, y_coords, c=colors, s=[v*10 for v in pm25_values_map], 
-                                 alpha=0.6, edgecolors='black', linewidths=1)
-            for i, (mote_id, data) in enumerate(pollution_map.items()):
-                ax2.annotate(mote_id, (x_coords[i], y_coords[i]), fontsize=8)
+        offsets = np.column_stack((x_coords, y_coords))
+        self._map_scatter.set_offsets(offsets)
+        self._map_scatter.set_sizes([v*10 for v in pm25_values_map])
+        self._map_scatter.set_facecolors(colors)
         
-        ax2.set_xlabel('X Coordinate')
-        ax2.set_ylabel('Y Coordinate')
-        ax2.set_title('Pollution Map (Size = PM2.5 Level)')
-        ax2.grid(True, alpha=0.3)
+        # Show one label per active mote, hiding labels of inactive motes
+        for mote_id, data in pollution_map.items():
+            label = self._map_labels.get(mote_id)
+            if label is None:
+                label = self._map_labels[mote_id] = ax2.annotate(mote_id, data['location'], fontsize=8)
+            label.xy = data['location']
+        for mote_id, label in self._map_labels.items():
+            label.set_visible(mote_id in pollution_map)
+        
+        # Grow the limits to include motes added after the first frame
+        ax2.update_datalim(offsets)
+        ax2.autoscale_view()
         
         # Plot 3: Statistics bar chart
         ax3 = self.axes[1, 0]
         stats = self.simulation.processor.get_statistics()
         
         if stats:
-            categories = ['Avg PM2.5', 'Avg PM10', 'Max PM2.5', 'Max PM10']
             values = [
                 stats.get('avg_pm25', 0),
                 stats.get('avg_pm10', 0),
                 stats.get('max_pm25', 0),
                 stats.get('max_pm10', 0)
             ]
-            colors_bar = ['blue', 'red', 'darkblue', 'darkred']
-            
-            bars = ax3.bar(categories, values, color=colors_bar, alpha=0.7, edgecolor='black')
-            ax3.axhline(y=SmartDustMote.PM25_SAFE_THRESHOLD, color='blue', linestyle='--', alpha=0.5)
-            ax3.axhline(y=SmartDustMote.PM10_SAFE_THRESHOLD, color='red', linestyle='--', alpha=0.5)
             
-            # Add value labels on bars
-            for bar, value in zip(bars, values):
-                height = bar.get_height()
-                ax3.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{value:.1f}', ha='center', va='bottom', fontweight='bold')
-            
-            ax3.set_ylabel('Particle Concentration (ug/m3)')
-            ax3.set_title('Pollution Statistics')
-            ax3.grid(True, alpha=0.3, axis='y')
+            # Update bar heights and value labels
+            for bar, label, value in zip(self._stat_bars, self._stat_labels, values):
+                bar.set_height(value)
+                label.set_y(value)
+                label.set_text(f'{value:.1f}')
+            ax3.relim()
+            ax3.autoscale_view()
         
         # Plot 4: Alert timeline
         ax4 = self.axes[1, 1]
         alerts = self.simulation.alert_system.alerts
         
         if alerts:
-            alert_times = [datetime.fromisoformat(a['timestamp']) for a in alerts[-20:]]
-            severities = [a['severity'] for a in alerts[-20:]]
+            recent_alerts = self.simulation.alert_system.get_recent_alerts(20)
+            alert_times = mdates.date2num([a['timestamp_dt'] for a in recent_alerts])
+            severities = [a['severity'] for a in recent_alerts]
             severity_numeric = {'LOW': 1, 'MODERATE': 2, 'HIGH': 3, 'CRITICAL': 4}
             severity_values = [severity_numeric.get(s, 0) for s in severities]
             
-            ax4.scatter(alert_times, severity_values, c='red', s=100, alpha=0.7, edgecolors='black')
-            ax4.set_yticks([1, 2, 3, 4])
-            ax4.set_yticklabels(['LOW', 'MODERATE', 'HIGH', 'CRITICAL'])
-            ax4.set_xlabel('Time')
-            ax4.set_ylabel('Alert Severity')
+            offsets = np.column_stack((alert_times, severity_values))
+            self._alert_scatter.set_offsets(offsets)
+            self._no_alerts_text.set_visible(False)
             ax4.set_title(f'Alert Timeline (Total: {len(alerts)})')
-            ax4.grid(True, alpha=0.3)
-        else:
-            ax4.text(0.5, 0.5, 'No Alerts\nAll Levels Safe', 
-                    ha='center', va='center', fontsize=14, color='green', 
-                    transform=ax4.transAxes)
-            ax4.set_title('Alert Timeline')
-        
-        plt.tight_layout()
+            
+            # Scatter points are not tracked by relim, so add them explicitly
+            ax4.relim()
+            ax4.update_datalim(offsets)
+            ax4.autoscale_view(scaley=False)
     
     def plot_historical(self, data_file: str = "dust_simulation_data.json"):
         """
@@ -160,6 +202,10 @@ class DustVisualizer:
         Args:
             data_file: Path to JSON file with simulation data
         """
+        import json
+        import os
+        import matplotlib.pyplot as plt
+        
         if not os.path.exists(data_file):
             print(f"Error: Data file '{data_file}' not found.")
             print("Please run the simulation first to generate data.")
@@ -175,7 +221,7 @@ class DustVisualizer:
         ax1 = axes[0, 0]
         readings = data.get('recent_readings', [])
         if readings:
-            timestamps = [datetime.fromisoformat(r['timestamp']) for r in readings]
+            timestamps = np.array([r['timestamp'] for r in readings], dtype='datetime64[us]')
             pm25_values = [r['pm25'] for r in readings]
             pm10_values = [r['pm10'] for r in readings]
             